@@ -9,18 +9,21 @@ Each machine should have been maintained about 300 times.
 from simprocesd.model import System
 from simprocesd.model.factory_floor import Source, Buffer, Sink, Maintainer
 from simprocesd.model.sensors import PeriodicSensor, AttributeProbe
-from simprocesd.utils import geometric_distribution_sample, print_finished_work_order_counts
+from simprocesd.utils import GeometricSamplePool, print_finished_work_order_counts
 
 from machine_with_damage import MachineWithDamage
 
 
+# Maintenance durations are sampled in batches. Indexed by whether the
+# machine is maintained before failing (damage < 4).
+_maintenance_duration_samplers = (
+    GeometricSamplePool(0.10).sample,  # maintenance for a failed machine
+    GeometricSamplePool(0.25).sample,  # maintenance before machine failure
+)
+
+
 def time_to_maintain(machine, tag):
-    if machine.damage < 4:
-        # maintenance before machine failure
-        return geometric_distribution_sample(0.25, 1)
-    else:
-        # maintenance for a failed machine
-        return geometric_distribution_sample(0.10, 1)
+    return _maintenance_duration_samplers[machine.damage < 4]()
 
 
 def main():
@@ -35,7 +38,7 @@ def main():
                            damage_on_degrade = 1,
                            damage_to_fail = 4,
                            get_maintenance_duration = time_to_maintain,
-                           get_capacity_to_maintain = lambda m, t: 1
+                           get_capacity_to_maintain = 1
     )
     B1 = Buffer(upstream = [M1], capacity = 10)
     M2 = MachineWithDamage(name = 'M2',
@@ -46,7 +49,7 @@ def main():
                            damage_on_degrade = 1,
                            damage_to_fail = 4,
                            get_maintenance_duration = time_to_maintain,
-                           get_capacity_to_maintain = lambda m, t: 1
+                           get_capacity_to_maintain = 1
     )
     sink = Sink(upstream = [M2])
 
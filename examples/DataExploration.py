@@ -2,27 +2,28 @@
 machines accrue damage over time which negatively impacts the quality of
 the parts those machines produce. Simulation data is then reviewed.
 '''
-import random
+from random import uniform as _uni
 import sys
 
 from simprocesd.model import System
 from simprocesd.model.factory_floor import Source, Buffer, Sink, PartGenerator, Maintainer
 from simprocesd.model.sensors import PeriodicSensor, Probe
-from simprocesd.utils import geometric_distribution_sample, plot_throughput, \
+from simprocesd.utils import GeometricSamplePool, plot_throughput, \
     plot_damage, plot_value, print_produced_parts_and_average_quality, simple_plot
 
 from machine_with_damage import MachineWithDamage
 
 
 def process_part(machine, part):
-    quality_change = 1 - machine.damage * (0.1 + random.uniform(-.01, .01))
+    quality_change = 1 - machine.damage * (0.1 + _uni(-.01, .01))
     part.quality += quality_change
     if quality_change > 0:
         part.add_value('part_processed', quality_change * 10)
 
 
 def new_machine(name, upstream, cycle_time, probability_to_degrade, maintainer):
-    time_to_maintain = lambda machine, tag: geometric_distribution_sample(0.25, 25)
+    maintenance_durations = GeometricSamplePool(0.25, 25)
+    time_to_maintain = lambda machine, tag: maintenance_durations.sample()
     machine = MachineWithDamage(name = name,
                                 upstream = upstream,
                                 cycle_time = cycle_time,
@@ -31,8 +32,8 @@ def new_machine(name, upstream, cycle_time, probability_to_degrade, maintainer):
                                 damage_on_degrade = 1,
                                 damage_to_fail = 3,
                                 get_maintenance_duration = time_to_maintain,
-                                get_capacity_to_maintain = lambda m, t: 1)
-    machine.add_finish_processing_callback(lambda m, p: process_part(m, p))
+                                get_capacity_to_maintain = 1)
+    machine.add_finish_processing_callback(process_part)
     machine.add_shutdown_callback(
             lambda m, is_failure, p: maintainer.create_work_order(m) if is_failure else None)
     return machine
@@ -2,7 +2,8 @@
 Average quality: ~80%
 Average weight: ~18
 '''
-import random
+from functools import partial
+from random import random as _rand
 
 from simprocesd.model import System
 from simprocesd.model.factory_floor import Part, PartGenerator, PartProcessor, Sink, Source
@@ -27,12 +28,12 @@ class CustomPartGenerator(PartGenerator):
         return CustomPart(part_name, self.quality, self.weight)
 
 
-def process_part(part, minQualityChange, maxQualityChange):
+def process_part(machine, part, minQualityChange, maxQualityChange):
     diff = maxQualityChange - minQualityChange
     # Quality is increased.
-    part.quality += maxQualityChange - diff * random.random()
+    part.quality += maxQualityChange - diff * _rand()
     # Weight is decreased.
-    part.weight *= 0.75 + 0.2 * random.random()
+    part.weight *= 0.75 + 0.2 * _rand()
 
 
 def main():
@@ -42,22 +43,20 @@ def main():
     M1 = PartProcessor('M1',
                        upstream = [source],
                        cycle_time = 1)
-    M1.add_finish_processing_callback(lambda m, p: process_part(p, 0.5, 0.75))
+    M1.add_finish_processing_callback(
+            partial(process_part, minQualityChange = 0.5, maxQualityChange = 0.75))
     M2 = PartProcessor('M2',
                        upstream = [M1],
                        cycle_time = 1)
-    M2.add_finish_processing_callback(lambda m, p: process_part(p, 0.1, 0.25))
-    sink = Sink(upstream = [M2], collect_parts = True)
+    M2.add_finish_processing_callback(
+            partial(process_part, minQualityChange = 0.1, maxQualityChange = 0.25))
+    sink = Sink(upstream = [M2], attribute_statistics = ['quality', 'weight'])
 
     # If time units are minutes then simulation period is a day.
     system.simulate(simulation_duration = 24 * 60)
 
-    average_quality = (
-        sum([part.quality for part in sink.collected_parts]) / len(sink.collected_parts)
-    )
-    average_weight = (
-        sum([part.weight for part in sink.collected_parts]) / len(sink.collected_parts)
-    )
+    average_quality = sink.attribute_statistics['quality'].mean
+    average_weight = sink.attribute_statistics['weight'].mean
     print(f'Average part quality: {average_quality:.2%}')
     print(f'Average part weight: {average_weight:.4g}')
 
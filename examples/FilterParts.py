@@ -4,19 +4,29 @@ PartFixer should have received about 750 parts.
 Processor average output part quality should be around 0.5
 PartFixer average output part quality should be between 0.9 and 1
 '''
+from functools import partial
 import random
 
+import numpy
+
 from simprocesd.model import System
 from simprocesd.model.factory_floor import Source, PartProcessor, Sink, DecisionGate
 from simprocesd.utils import print_produced_parts_and_average_quality
 
 
-def process_part(machine, part):
-    part.quality = random.random()
+def quality_samples(rng, batch_size = 1000):
+    # Sample qualities in batches instead of one random call per part.
+    while True:
+        yield from rng.random(batch_size).tolist()
+
+
+def process_part(machine, part, qualities):
+    part.quality = next(qualities)
 
 
 def improve_part(machine, part):
-    part.quality = min(1, part.quality + 0.75)
+    quality = part.quality + 0.75
+    part.quality = quality if quality < 1 else 1
 
 
 def main():
@@ -24,7 +34,8 @@ def main():
 
     source = Source()
     M1 = PartProcessor('Processor', upstream = [source], cycle_time = 1)
-    M1.add_finish_processing_callback(process_part)
+    qualities = quality_samples(numpy.random.default_rng(1))
+    M1.add_finish_processing_callback(partial(process_part, qualities = qualities))
     # DecisionGate conditions are setup so that processed parts can
     # always pass at least one of them, otherwise parts may get stuck in the
     # processor preventing it from working on new parts.
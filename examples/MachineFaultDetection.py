@@ -7,26 +7,29 @@ In perfect conditions each machine is expected to affect the part
 quality equally.
 Expected machine with lowest part quality impact: M5
 '''
+from functools import partial
 import random
+from random import uniform as _uni
 
 import numpy
 from scipy.optimize import minimize
 
 from simprocesd.model import System
 from simprocesd.model.factory_floor import Source, Buffer, Sink, PartGenerator, Maintainer
-from simprocesd.utils import geometric_distribution_sample, \
+from simprocesd.utils import GeometricSamplePool, \
     print_produced_parts_and_average_quality
 
 from machine_with_damage import MachineWithDamage
 
 
 def process_part(machine, part, quality_distribution):
-    part.quality -= quality_distribution() * (machine.damage + random.uniform(-.01, .01))
+    part.quality -= quality_distribution() * (machine.damage + _uni(-.01, .01))
 
 
 def new_machine(name, upstream, cycle_time, probability_to_degrade,
                 quality_distribution, maintainer):
-    time_to_maintain = lambda m, d: geometric_distribution_sample(0.1, 1)
+    maintenance_durations = GeometricSamplePool(0.1)
+    time_to_maintain = lambda m, d: maintenance_durations.sample()
     machine = MachineWithDamage(name = name,
                                 upstream = upstream,
                                 cycle_time = cycle_time,
@@ -35,8 +38,9 @@ def new_machine(name, upstream, cycle_time, probability_to_degrade,
                                 damage_on_degrade = 1,
                                 damage_to_fail = 5,
                                 get_maintenance_duration = time_to_maintain,
-                                get_capacity_to_maintain = lambda m, d: 1)
-    machine.add_finish_processing_callback(lambda m, p: process_part(m, p, quality_distribution))
+                                get_capacity_to_maintain = 1)
+    machine.add_finish_processing_callback(
+            partial(process_part, quality_distribution = quality_distribution))
     machine.add_shutdown_callback(
             lambda m, is_failure, p: maintainer.create_work_order(m) if is_failure else None)
     return machine
@@ -47,19 +51,19 @@ def main():
 
     maintainer = Maintainer(capacity = 1)
     source = Source('Source', PartGenerator('Part', 1, 2))
-    M1 = new_machine('M1', [source], 1, 0.02, lambda: random.uniform(0, 0.01), maintainer)
+    M1 = new_machine('M1', [source], 1, 0.02, partial(_uni, 0, 0.01), maintainer)
     stage1 = [M1]
     B1 = Buffer('B1', stage1, capacity = 20)
-    M2 = new_machine('M2', [B1], 1, 0.02, lambda: random.uniform(0, 0.01), maintainer)
-    M3 = new_machine('M3', [B1], 1, 0.02, lambda: random.uniform(0, 0.02), maintainer)
+    M2 = new_machine('M2', [B1], 1, 0.02, partial(_uni, 0, 0.01), maintainer)
+    M3 = new_machine('M3', [B1], 1, 0.02, partial(_uni, 0, 0.02), maintainer)
     stage2 = [M2, M3]
     B2 = Buffer('B2', stage2, capacity = 10)
-    M4 = new_machine('M4', [B2], 1, 0.02, lambda: random.uniform(0.01, 0.02), maintainer)
-    M5 = new_machine('M5', [B2], 1, 0.05, lambda: random.uniform(0.025, 0.05), maintainer)
+    M4 = new_machine('M4', [B2], 1, 0.02, partial(_uni, 0.01, 0.02), maintainer)
+    M5 = new_machine('M5', [B2], 1, 0.05, partial(_uni, 0.025, 0.05), maintainer)
     stage3 = [M4, M5]
     B3 = Buffer('B3', stage3, capacity = 10)
-    M6 = new_machine('M6', [B3], 1, 0.02, lambda: random.uniform(0, 0.02), maintainer)
-    M7 = new_machine('M7', [B3], 1, 0.02, lambda: random.uniform(0.01, 0.02), maintainer)
+    M6 = new_machine('M6', [B3], 1, 0.02, partial(_uni, 0, 0.02), maintainer)
+    M7 = new_machine('M7', [B3], 1, 0.02, partial(_uni, 0.01, 0.02), maintainer)
     stage4 = [M6, M7]
     sink = Sink('Sink', stage4, collect_parts = True)
 
@@ -76,14 +80,20 @@ def main():
     print(f'  {unique_machine_names}')
 
     # Path quality analysis, get unique paths.
-    collected_part_data = []
+    unique_machine_name_set = set(unique_machine_names)
+    part_path_indexes = []
+    part_qualities = numpy.fromiter((part.quality for part in sink.collected_parts),
+                                    dtype = numpy.float64, count = len(sink.collected_parts))
     unique_paths = []
+    path_indexes = {}
     for part in sink.collected_parts:
-        routing_path = [m.name for m in part.routing_history if m.name in unique_machine_names]
-        if routing_path not in unique_paths:
-            unique_paths.append(routing_path)
-        path_index = unique_paths.index(routing_path)
-        collected_part_data.append((path_index, part.quality))
+        routing_path = tuple(m.name for m in part.routing_history
+                             if m.name in unique_machine_name_set)
+        path_index = path_indexes.get(routing_path)
+        if path_index == None:
+            path_index = path_indexes[routing_path] = len(unique_paths)
+            unique_paths.append(list(routing_path))
+        part_path_indexes.append(path_index)
     print('Unique paths:')
     print(f'  {unique_paths}')
 
@@ -98,18 +108,22 @@ def main():
     print(f'  {paths_map}')
 
     # Calculate path quality.
-    part_qualities_in_paths = [[] for i in range(len(unique_paths))]
-    for path_index, quality in collected_part_data:
-        part_qualities_in_paths[path_index].append(quality)
-    path_quality = [sum(pq) / len(pq) for pq in part_qualities_in_paths]
+    part_path_indexes = numpy.asarray(part_path_indexes, dtype = numpy.intp)
+    path_quality = (numpy.bincount(part_path_indexes, weights = part_qualities)
+                    / numpy.bincount(part_path_indexes)).tolist()
     print('Path quality:')
     print(f'  {path_quality}')
 
-    error = lambda b: numpy.sum(numpy.abs(numpy.dot(paths_map, b) - path_quality))
+    # Convert once so the objective does not re-cast lists on every
+    # evaluation. Gradient is provided to avoid finite differences.
+    paths_matrix = numpy.asarray(paths_map, dtype = numpy.float64)
+    path_quality_array = numpy.asarray(path_quality, dtype = numpy.float64)
+    error = lambda b: numpy.abs(paths_matrix @ b - path_quality_array).sum()
+    error_gradient = lambda b: paths_matrix.T @ numpy.sign(paths_matrix @ b - path_quality_array)
     lb = -1
     ub = 1
     bnds = [(lb, ub) for i in range(len(unique_machines))]
-    res = minimize(error, x0 = [1] * len(unique_machines), bounds = bnds,
+    res = minimize(error, x0 = [1] * len(unique_machines), jac = error_gradient, bounds = bnds,
                    options = {'ftol':1e-7, 'gtol':1e-7})
     print('Predicted machine\'s part quality impact [M1-M7]:')
     predicted_part_quality_impact = str(res.x).replace('\n', '')  # Remove newlines
@@ -6,10 +6,10 @@ which negatively affects the part quality (0-1). Only parts of quality
 min_acceptable_quality and higher are considered good/acceptable.
 '''
 import random
-import statistics
 import sys
 
 from matplotlib import pyplot
+import numpy as np
 
 from simprocesd.model import System
 from simprocesd.model.factory_floor import Source, Sink, Maintainer
@@ -40,46 +40,58 @@ def simulation(system, index, damage_threshold):
     M4 = CustomMachineWithDamage('M4', [source], maintainer, damage_threshold)
     M5 = CustomMachineWithDamage('M5', [source], maintainer, damage_threshold)
     all_machines = [M1, M2, M3, M4, M5]
-    sink = Sink('Sink', all_machines, collect_parts = True)
+    sink = Sink('Sink', all_machines, collect_attributes = ['quality'])
 
     system.simulate(simulation_duration = simulation_duration, print_summary = False)
 
 
+def sweep_simulation(system, index, thresholds, iteration_count):
+    # Consecutive simulation indexes are iterations of the same threshold.
+    simulation(system, index, thresholds[index // iteration_count])
+
+
 def main(is_test = False):
-    global iterations
-    if is_test:
-        # Reduce example runtime during testing.
-        iterations = 1
+    # Reduce example runtime during testing.
+    iteration_count = 1 if is_test else iterations
 
     print('Running simulations...')
-    all_parts_per_dt = []
     # Damage thresholds go from d_magnitude to d_fail in increments
     # of  d_magnitude.
     thresholds = [x * d_magnitude for x in range(1, round(d_fail / d_magnitude) + 1)]
     tested_policies_count = len(thresholds)
 
-    # Loop for collecting data on each maintenance policy.
-    for current_threshold in thresholds:
-        damage_threshold = current_threshold
-        systems = System.simulate_multiple_times(simulation = simulation,
-                                                 number_of_simulations = iterations,
-                                                 max_processes = 4,
-                                                 damage_threshold = damage_threshold)
-        all_parts_per_dt.append([])
-        # Collect completed Parts quality from each iteration.
-        for s in systems:
-            sink = s.find_assets(name = 'Sink')[0]
-            all_parts_per_dt[-1] += ([x.quality for x in sink.collected_parts])
+    # All simulations of all maintenance policies are submitted at once
+    # so processes do not wait for the slowest simulation of a policy
+    # before starting on the next policy.
+    simulation_count = iteration_count * tested_policies_count
+    systems = System.simulate_multiple_times(simulation = sweep_simulation,
+                                             number_of_simulations = simulation_count,
+                                             max_processes = None,
+                                             thresholds = thresholds,
+                                             iteration_count = iteration_count)
+    # Collect completed Parts quality from each iteration.
+    qualities = [np.array(s.find_assets(name = 'Sink')[0].collected_attribute_values['quality'],
+                          dtype = np.float64)
+                 for s in systems]
+    # Group every Part's quality by the maintenance policy it was
+    # simulated with.
+    policy_indexes = np.repeat(np.arange(simulation_count) // iteration_count,
+                               [q.size for q in qualities])
+    qualities = np.concatenate(qualities)
+    is_good = qualities >= min_acceptable_quality
 
     # Get means for each maintenance policy.
-    mean_part_count_per_dt = [len(dt) / iterations for dt in all_parts_per_dt]
-    mean_good_part_count_per_dt = [len([x for x in dt if x >= min_acceptable_quality]) / iterations
-                                   for dt in all_parts_per_dt]
-    mean_bad_part_count_per_dt = [mean_part_count_per_dt[i] - mean_good_part_count_per_dt[i]
-                                  for i in range(tested_policies_count)]
-    mean_quality_per_dt = [statistics.mean(dt) for dt in all_parts_per_dt]
-    mean_quality_good_parts_per_dt = [statistics.mean([x for x in dt if x >= min_acceptable_quality])
-                                      for dt in all_parts_per_dt]
+    part_count_per_dt = np.bincount(policy_indexes, minlength = tested_policies_count)
+    good_part_count_per_dt = np.bincount(policy_indexes[is_good], minlength = tested_policies_count)
+    mean_part_count_per_dt = part_count_per_dt / iteration_count
+    mean_good_part_count_per_dt = good_part_count_per_dt / iteration_count
+    mean_bad_part_count_per_dt = mean_part_count_per_dt - mean_good_part_count_per_dt
+    quality_sum_per_dt = np.bincount(policy_indexes, weights = qualities,
+                                     minlength = tested_policies_count)
+    good_quality_sum_per_dt = np.bincount(policy_indexes[is_good], weights = qualities[is_good],
+                                          minlength = tested_policies_count)
+    mean_quality_per_dt = quality_sum_per_dt / part_count_per_dt
+    mean_quality_good_parts_per_dt = good_quality_sum_per_dt / good_part_count_per_dt
 
     # Plot the data.
     figure, (g1, g2) = pyplot.subplots(1, 2, figsize = (12, 6))
@@ -122,6 +134,11 @@ class CustomMachineWithDamage(MachineWithDamage):
                          damage_to_fail = d_fail)
         self._maintainer = maintainer
         self._maintenance_threshhold = maintenance_threshhold
+        # Standard normal noise is sampled in batches. The generator is
+        # seeded from Python's 'random' module so seeding it still makes
+        # simulations repeatable.
+        self._rng = np.random.default_rng(random.getrandbits(64))
+        self._noise = []
 
         self.add_finish_processing_callback(self._finish_processing)
         self.add_on_degrade_callback(self._on_status_degrade)
@@ -131,7 +148,14 @@ class CustomMachineWithDamage(MachineWithDamage):
         damage = machine.damage
         # Damage negatively affects part quality. The relationship is
         # exponential. Gauss distribution is used for noise.
-        part.quality = max(0, 1 - max(0, random.gauss(pow(damage, 3) * 0.01, .1)))
+        noise = self._noise
+        if len(noise) == 0:
+            noise.extend(self._rng.standard_normal(4096).tolist())
+        quality_loss = damage * damage * damage * 0.01 + .1 * noise.pop()
+        if quality_loss <= 0:
+            part.quality = 1
+        else:
+            part.quality = 1 - quality_loss if quality_loss < 1 else 0
 
     def _on_status_degrade(self, machine):
         # Request maintenance if damage is above threshold.
@@ -5,9 +5,13 @@ Expected parts produced: 750005
 Expected yearly operational profit of using a CMS is: about $130,000
 '''
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import random
 import sys
 
+import numpy
+
 from simprocesd.model import System
 from simprocesd.model.factory_floor import Source, Sink, PartGenerator, Maintainer
 from simprocesd.model.sensors import OutputPartSensor, AttributeProbe, Probe
@@ -30,11 +34,15 @@ def main(is_test = False):
         # Reduce example runtime for test.
         duration /= 100
 
-    random.seed(1)
-
-    no_cms_net = sample(duration, False)
+    # Both simulations are independent so they run in separate
+    # processes, each with its own reproducible seed.
+    no_cms_seed, with_cms_seed = numpy.random.SeedSequence(1).spawn(2)
+    with ProcessPoolExecutor(2) as process_pool:
+        no_cms_future = process_pool.submit(sample, duration, False, no_cms_seed)
+        with_cms_future = process_pool.submit(sample, duration, True, with_cms_seed)
+        no_cms_net = no_cms_future.result()
+        with_cms_net = with_cms_future.result()
     print(f'Net value without CMS: ${no_cms_net}')
-    with_cms_net = sample(duration, True)
     print(f'Net value with CMS: ${with_cms_net}')
     print(f'Yearly operational profit of using a CMS is: ${with_cms_net - no_cms_net}')
 
@@ -55,8 +63,11 @@ class CustomCms(CmsEmulator):
             self.check_for_false_alerts()
 
 
-def sample(duration, with_cms):
+def sample(duration, with_cms, seed_sequence):
     system = System()
+    random.seed(int(seed_sequence.generate_state(1)[0]))
+    # Time to fault samples are drawn in batches.
+    rng = numpy.random.default_rng(seed_sequence)
 
     source = Source(part_generator = PartGenerator('Raw', value = 0, quality = 1))
 
@@ -65,18 +76,18 @@ def sample(duration, with_cms):
     M1.add_recurring_fault(
         name = dulling_name,
         # Failure rate of once in 100 days.
-        get_time_to_fault = lambda: distributed_ttf(100),
-        get_cost_to_fix = lambda: 100,
-        get_false_alert_cost = lambda: 85,
+        get_time_to_fault = partial(next, distributed_ttf(rng, 100)),
+        get_cost_to_fix = 100,
+        get_false_alert_cost = 85,
         is_hard_fault = False,
         receive_part_callback = wasted_part_processing
     )
     M1.add_recurring_fault(
         name = ma_name,
         # Failure rate of ~99% per day.
-        get_time_to_fault = lambda: distributed_ttf(1.01),
-        get_cost_to_fix = lambda: 75,
-        get_false_alert_cost = lambda: 85,
+        get_time_to_fault = partial(next, distributed_ttf(rng, 1.01)),
+        get_cost_to_fix = 75,
+        get_false_alert_cost = 85,
         is_hard_fault = False,
         receive_part_callback = wasted_part_processing
     )
@@ -106,9 +117,10 @@ def sample(duration, with_cms):
     return system.get_net_value_of_assets()
 
 
-def distributed_ttf(days_to_fault):
+def distributed_ttf(rng, days_to_fault, batch_size = 256):
     ttf = days_to_fault * operating_time_per_day
-    return random.normalvariate(ttf, ttf * 0.05)
+    while True:
+        yield from rng.normal(ttf, ttf * 0.05, batch_size).tolist()
 
 
 def wasted_part_processing(part):
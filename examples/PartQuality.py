@@ -3,35 +3,47 @@ M1 average quality: ~95%
 M2 average quality: ~67%
 M3 average quality: ~43%
 '''
+from functools import partial
 import random
 
+import numpy
+
 from simprocesd.model import System
 from simprocesd.model.factory_floor import PartGenerator, Source, PartProcessor, Buffer, Sink
 from simprocesd.utils.simulation_info_utils import print_produced_parts_and_average_quality
 
 
-def update_quality(part, min_, max_):
-    diff = max_ - min_
-    part.quality *= max_ - diff * random.random()
+def uniform_samples(rng, batch_size = 4096):
+    # Sample in batches instead of one random call per part.
+    while True:
+        yield from rng.random(batch_size).tolist()
+
+
+def update_quality(machine, part, min_, max_, samples):
+    part.quality *= max_ - (max_ - min_) * next(samples)
 
 
 def main():
     system = System()
+    samples = uniform_samples(numpy.random.default_rng(1))
 
     source = Source(part_generator = PartGenerator('Part', value = 0, quality = 1))
     M1 = PartProcessor('M1',
                        upstream = [source],
                        cycle_time = 1)
-    M1.add_finish_processing_callback(lambda m, p: update_quality(p, 0.9, 1))
+    M1.add_finish_processing_callback(
+            partial(update_quality, min_ = 0.9, max_ = 1, samples = samples))
     B1 = Buffer('B1', upstream = [M1], capacity = 10)
     M2 = PartProcessor('M2',
                        upstream = [B1],
                        cycle_time = 2)
-    M2.add_finish_processing_callback(lambda m, p: update_quality(p, 0.6, 0.8))
+    M2.add_finish_processing_callback(
+            partial(update_quality, min_ = 0.6, max_ = 0.8, samples = samples))
     M3 = PartProcessor('M3',
                        upstream = [B1],
                        cycle_time = 2)
-    M3.add_finish_processing_callback(lambda m, p: update_quality(p, 0.3, 0.6))
+    M3.add_finish_processing_callback(
+            partial(update_quality, min_ = 0.3, max_ = 0.6, samples = samples))
     sink = Sink(upstream = [M2, M3], collect_parts = True)
 
     random.seed(1)
@@ -11,14 +11,15 @@ User can configure settings to see how it affects production:
 At the end of the simulation user is presented with graphs to help
 evaluate the effectiveness of the current configuration.
 '''
+from functools import partial
 import sys
 
 from matplotlib import pyplot
 from simprocesd.model import System
 from simprocesd.model.factory_floor import ActionScheduler, Buffer, DecisionGate, PartProcessor, \
     Sink, Source
+from simprocesd.utils import UniformSamplePool
 from simprocesd.utils.simulation_info_utils import plot_buffer_levels, plot_resources
-import random
 from simprocesd.model.factory_floor.group import Group
 
 
@@ -31,20 +32,19 @@ class MachineSchedule(ActionScheduler):
 class OperatorSchedule(ActionScheduler):
 
     def default_action(self, resource_manager, time, new_limit):
-        current_total = resource_manager.get_resource_capacity('operators')
-        resource_manager.add_resources('operators', new_limit - current_total)
+        resource_manager.set_resource_capacity('operators', new_limit)
 
 
 def M3_process(machine, part):
     part.quality = 1
 
 
-def M4_process(machine, part):
-    part.quality = random.random()  # 0 to 1
+def M4_process(machine, part, quality_samples):
+    part.quality = quality_samples.sample()  # 0 to 1
 
 
 def M2_on_received_part(machine, part):
-    previous_device_name = part.routing_history[-2].name
+    previous_device_name = part.get_routing_history_entry(-2).name
     if previous_device_name == 'G1':
         machine.cycle_time = 23
     elif previous_device_name == 'G2':
@@ -87,7 +87,8 @@ def main(is_test = False):
     B2 = Buffer('B2', upstream = [M3], capacity = buffer_capacity)
     M4 = PartProcessor('M4', upstream = [B2], cycle_time = 12,
                        resources_for_processing = {'operators': 1, 'power': 95000})
-    M4.add_finish_processing_callback(M4_process)
+    M4.add_finish_processing_callback(
+            partial(M4_process, quality_samples = UniformSamplePool()))
     gate1 = DecisionGate(decider_override = lambda g, part: part.quality < 0.8, upstream = [M4])
     gate2 = DecisionGate(decider_override = lambda g, part: part.quality >= 0.8, upstream = [M4])
     B1.set_upstream(list(B1.upstream) + [gate1])
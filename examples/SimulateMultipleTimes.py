@@ -2,6 +2,7 @@
 Use that function to run multiple simulations.
 Collect data from each simulation and graph it.
 '''
+from functools import partial
 import random
 import statistics
 import sys
@@ -9,12 +10,13 @@ import time
 
 from simprocesd.model import System
 from simprocesd.model.factory_floor import Source, PartProcessor, Sink
+from simprocesd.utils import UniformSamplePool
 from simprocesd.utils.simulation_info_utils import simple_plot
 
 
 # Part quality will be randomly distributed between 0 and 1
-def process_part(processor, part):
-    part.quality = random.random()
+def process_part(processor, part, quality_samples):
+    part.quality = quality_samples.sample()
 
 
 def simulation(system, index):
@@ -25,7 +27,10 @@ def simulation(system, index):
     source = Source(cycle_time = 1)
     M1 = PartProcessor('M1', upstream = [source], cycle_time = 1)
 
-    M1.add_finish_processing_callback(process_part)
+    # Sample pool is created per simulation after seeding so it does
+    # not carry samples over between simulations in the same process.
+    M1.add_finish_processing_callback(
+            partial(process_part, quality_samples = UniformSamplePool()))
     sink = Sink(upstream = [M1])
     system.simulate(simulation_duration = 100, print_summary = False)
 
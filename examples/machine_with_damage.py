@@ -21,13 +21,15 @@ class MachineWithDamage(PartProcessor):
     damage_to_fail -- accumulated damage threshold when the machine
         fails.
     get_maintenance_duration -- a function that returns the duration
-        of the maintenance.
+        of the maintenance or a number if the duration is constant.
         Callback signature: callback(machine, maintenance_tag)
     get_capacity_to_maintain -- a function that returns the needed
-        maintainer capacity for machine maintenance.
+        maintainer capacity for machine maintenance or a number if the
+        capacity is constant.
         Callback signature: callback(machine, maintenance_tag)
     get_cost_to_maintain -- a function that returns the Maintainer
-        cost in order to maintain this machine.
+        cost in order to maintain this machine or a number if the cost
+        is constant.
         Callback signature: callback(machine, maintenance_tag)
     '''
 
@@ -49,10 +51,14 @@ class MachineWithDamage(PartProcessor):
         self._damage_on_degrade = damage_on_degrade
         self._damage_to_fail = damage_to_fail
         self._probability_to_degrade = probability_to_degrade
-        self._get_maintenance_duration = get_maintenance_duration
-        self._get_capacity_to_maintain = get_capacity_to_maintain
-        self._get_cost_to_maintain = get_cost_to_maintain
-        self._on_degrade_callbacks = []
+        # None means no duration/capacity/cost. Numbers are stored as is
+        # and returned without calling a function.
+        self._get_maintenance_duration = (
+                0 if get_maintenance_duration == None else get_maintenance_duration)
+        self._get_capacity_to_maintain = (
+                0 if get_capacity_to_maintain == None else get_capacity_to_maintain)
+        self._get_cost_to_maintain = 0 if get_cost_to_maintain == None else get_cost_to_maintain
+        self._on_degrade_callbacks = ()
 
     @property
     def damage(self):
@@ -77,10 +83,10 @@ class MachineWithDamage(PartProcessor):
         callback -- function with a signature callback(this_machine)
         '''
         assert_callable(callback)
-        self._on_degrade_callbacks.append(callback)
+        self._on_degrade_callbacks += (callback,)
 
     def _is_operational(self):
-        return self.damage < self._damage_to_fail
+        return self._damage < self._damage_to_fail
 
     def _prepare_next_degrade_event(self):
         if self._period_to_degrade <= 0 or self._probability_to_degrade <= 0:
@@ -88,14 +94,15 @@ class MachineWithDamage(PartProcessor):
 
         time_to_degrade = geometric_distribution_sample(
                 self._probability_to_degrade, 1) * self._period_to_degrade
-        self._env.schedule_event(self._env.now + time_to_degrade,
-                                 self.id,
-                                 self._degrade,
-                                 EventType.OTHER_HIGH_PRIORITY,
-                                 f'Machine degrade.')
+        env = self._env
+        env.schedule_event(env.now + time_to_degrade,
+                           self.id,
+                           self._degrade,
+                           EventType.OTHER_HIGH_PRIORITY,
+                           'Machine degrade.')
 
     def _degrade(self):
-        self.damage += self._damage_on_degrade
+        self.damage = self._damage + self._damage_on_degrade
         if self._is_operational():
             self._prepare_next_degrade_event()
         else:
@@ -106,19 +113,19 @@ class MachineWithDamage(PartProcessor):
 
     # Beginning of Maintainable function overrides.
     def get_work_order_duration(self, tag):
-        if self._get_maintenance_duration == None:
-            return 0
-        return self._get_maintenance_duration(self, tag)
+        if callable(self._get_maintenance_duration):
+            return self._get_maintenance_duration(self, tag)
+        return self._get_maintenance_duration
 
     def get_work_order_capacity(self, tag):
-        if self._get_capacity_to_maintain == None:
-            return 0
-        return self._get_capacity_to_maintain(self, tag)
+        if callable(self._get_capacity_to_maintain):
+            return self._get_capacity_to_maintain(self, tag)
+        return self._get_capacity_to_maintain
 
     def get_work_order_cost(self, tag):
-        if self._get_cost_to_maintain == None:
-            return 0
-        return self._get_cost_to_maintain(self, tag)
+        if callable(self._get_cost_to_maintain):
+            return self._get_cost_to_maintain(self, tag)
+        return self._get_cost_to_maintain
 
     def start_work(self, tag):
         self.shutdown()
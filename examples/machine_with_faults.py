@@ -1,9 +1,9 @@
-import random
+from functools import partial
 
 from simprocesd.model.cms.cms import Cms
 from simprocesd.model.factory_floor import PartProcessor
 from simprocesd.model.simulation import EventType
-from simprocesd.utils import assert_callable
+from simprocesd.utils import assert_callable, UniformSamplePool
 
 
 class MachineWithFaults(PartProcessor):
@@ -27,6 +27,10 @@ class MachineWithFaults(PartProcessor):
         super().__init__(name, upstream, cycle_time, value)
         self._possible_faults = {}  # name, MachineFault
         self._active_faults = {}  # name, MachineFault
+        # Faults triggered by operation count, checked for every Part.
+        self._operation_faults = ()
+        # Active faults that have a receive_part_callback.
+        self._part_callback_faults = ()
 
     @property
     def active_faults(self):
@@ -34,20 +38,22 @@ class MachineWithFaults(PartProcessor):
 
     def initialize(self, env):
         super().initialize(env)
+        self._operation_faults = tuple(f for f in self._possible_faults.values()
+                                       if f.get_operations_to_fault != None)
+        self._update_part_callback_faults()
 
-        for n, f in self._possible_faults.items():
+        for f in self._possible_faults.values():
             f.initialize(self)
             self._prepare_fault(f)
 
     def _on_received_new_part(self):
         super()._on_received_new_part()
         # Fault callbacks.
-        for n, f in self._active_faults.items():
-            if f.receive_part_callback != None:
-                f.receive_part_callback(self._part)
+        for f in self._part_callback_faults:
+            f.receive_part_callback(self._part)
 
         # Check if any faults need to cause machine to fail
-        for n, f in self._possible_faults.items():
+        for f in self._operation_faults:
             if f.operations_to_fault != None:
                 f.operations_since_last_fix += 1
                 if f.operations_since_last_fix >= f.operations_to_fault:
@@ -56,17 +62,17 @@ class MachineWithFaults(PartProcessor):
                     f.operations_to_fault = None
                     self._env.schedule_event(self._env.now,
                                              self.id,
-                                             lambda: self._scheduled_fault(f),
+                                             partial(self._scheduled_fault, f),
                                              EventType.FAIL,
-                                             f'Cycle count fault: {n}')
+                                             f.cycle_count_fault_message)
 
     def add_recurring_fault(self,
                  name = None,
                  get_time_to_fault = None,
                  get_operations_to_fault = None,  # start of n-th operation will trigger fault
-                 get_time_to_maintain = lambda: 0,
-                 get_cost_to_fix = lambda: 0,
-                 get_false_alert_cost = lambda: 0,
+                 get_time_to_maintain = 0,
+                 get_cost_to_fix = 0,
+                 get_false_alert_cost = 0,
                  is_hard_fault = True,  # will machine keep operating when fault occurs
                  capacity_to_repair = 1,
                  receive_part_callback = None,
@@ -81,9 +87,11 @@ class MachineWithFaults(PartProcessor):
         get_operations_to_fault -- function that returns n and n-th
             operation will trigger the fault, n is infinite if not set.
         get_time_to_maintain -- how long it takes for maintenance to
-            fix this fault.
-        get_cost_to_fix -- how much it costs to fix this fault.
-        get_false_alert_cost -- how much it costs to fix this fault.
+            fix this fault. A function or a constant number.
+        get_cost_to_fix -- how much it costs to fix this fault. A
+            function or a constant number.
+        get_false_alert_cost -- how much it costs to fix this fault. A
+            function or a constant number.
         is_hard_fault -- will machine keep operating when fault occurs.
         capacity_to_repair -- maintainer capacity needed while
             maintaining this fault.
@@ -116,25 +124,31 @@ class MachineWithFaults(PartProcessor):
             if fault.scheduled_fault_time != None:
                 self._env.schedule_event(fault.scheduled_fault_time,
                                          self.id,
-                                         lambda: self._scheduled_fault(fault),
+                                         partial(self._scheduled_fault, fault),
                                          EventType.FAIL,
-                                         f'Timed fault: {fault.name}')
+                                         fault.timed_fault_message)
 
         # Prepare operations based fault
         if (fault.get_operations_to_fault != None
                 and fault.operations_to_fault == None):
             fault.operations_to_fault = fault.get_operations_to_fault()
 
+    def _update_part_callback_faults(self):
+        self._part_callback_faults = tuple(f for f in self._active_faults.values()
+                                           if f.receive_part_callback != None)
+
     def _scheduled_fault(self, fault):
         self._active_faults[fault.name] = fault
+        self._update_part_callback_faults()
         # Reset trackers because fault occurred
         fault.scheduled_fault_time = None
         fault.operations_to_fault = None
         fault.operations_since_last_fix = 0
 
-        # Save time to fault if there are other faults waiting to happen.
+        # Save time to fault if there are other faults waiting to happen,
+        # their events are cancelled when the machine fails.
         if fault.is_hard_fault:
-            for n, f in self._active_faults.items():
+            for f in self._possible_faults.values():
                 if fault != f and f.scheduled_fault_time != None:
                     f.remaining_time_to_fault = max(0, f.scheduled_fault_time - self._env.now)
                     f.scheduled_fault_time = None
@@ -147,7 +161,10 @@ class MachineWithFaults(PartProcessor):
 
     # Beginning of Maintainable function overrides.
     def get_work_order_duration(self, fault_name):
-        return self._possible_faults[fault_name].get_time_to_maintain()
+        get_time_to_maintain = self._possible_faults[fault_name].get_time_to_maintain
+        if callable(get_time_to_maintain):
+            return get_time_to_maintain()
+        return get_time_to_maintain
 
     def get_work_order_capacity(self, fault_name):
         return self._possible_faults[fault_name].capacity_to_repair
@@ -162,18 +179,36 @@ class MachineWithFaults(PartProcessor):
         f = self._active_faults.get(fault_name)
         if f != None:
             del self._active_faults[fault_name]
-            self.add_cost(f'fix-{fault_name}', f.get_cost_to_fix())
+            self._update_part_callback_faults()
+            cost = f.get_cost_to_fix() if callable(f.get_cost_to_fix) else f.get_cost_to_fix
+            self.add_cost(f'fix-{fault_name}', cost)
             self._prepare_fault(f)
         else:
             f = self._possible_faults[fault_name]
-            self.add_cost(f'fix_false_alert-{fault_name}', f.get_false_alert_cost())
-
+            cost = (f.get_false_alert_cost() if callable(f.get_false_alert_cost)
+                    else f.get_false_alert_cost)
+            self.add_cost(f'fix_false_alert-{fault_name}', cost)
+
+        # Resume faults that were waiting to happen when the machine failed
+        # once no hard faults remain.
+        if not any(f.is_hard_fault for f in self._active_faults.values()):
+            for f in self._possible_faults.values():
+                if f.remaining_time_to_fault != None:
+                    self._prepare_fault(f)
         self.restore_functionality()
     # End of Maintainable function overrides.
 
 
 class RecurringMachineFault:
 
+    # Slots reduce memory footprint and speed up attribute access.
+    __slots__ = ('name', 'get_time_to_fault', 'get_operations_to_fault', 'is_hard_fault',
+                 'get_time_to_maintain', 'get_cost_to_fix', 'get_false_alert_cost',
+                 'capacity_to_repair', 'receive_part_callback', 'failed_callback',
+                 'timed_fault_message', 'cycle_count_fault_message', 'scheduled_fault_time',
+                 'remaining_time_to_fault', 'operations_since_last_fix', 'operations_to_fault',
+                 '_machine')
+
     def __init__(self,
                  name,
                  get_time_to_fault,
@@ -186,13 +221,15 @@ class RecurringMachineFault:
                  receive_part_callback,
                  failed_callback
                  ):
-        assert_callable(get_time_to_fault, True)
-        assert_callable(get_operations_to_fault, True)
-        assert_callable(get_time_to_maintain, False)
-        assert_callable(get_cost_to_fix, False)
-        assert_callable(get_false_alert_cost, False)
-        assert_callable(receive_part_callback, True)
-        assert_callable(failed_callback, True)
+        if __debug__:
+            assert_callable(get_time_to_fault, True)
+            assert_callable(get_operations_to_fault, True)
+            # Constant numbers are used as is without a function call.
+            for get_number in (get_time_to_maintain, get_cost_to_fix, get_false_alert_cost):
+                if not isinstance(get_number, (int, float)):
+                    assert_callable(get_number, False)
+            assert_callable(receive_part_callback, True)
+            assert_callable(failed_callback, True)
 
         self.name = name
         self.get_time_to_fault = get_time_to_fault
@@ -204,6 +241,9 @@ class RecurringMachineFault:
         self.capacity_to_repair = capacity_to_repair
         self.receive_part_callback = receive_part_callback
         self.failed_callback = failed_callback
+        # Event messages are built once instead of for every fault.
+        self.timed_fault_message = f'Timed fault: {name}'
+        self.cycle_count_fault_message = f'Cycle count fault: {name}'
 
         self.scheduled_fault_time = None
         self.remaining_time_to_fault = None
@@ -225,22 +265,21 @@ class RecurringMachineFault:
 class CmsEmulator(Cms):
     ''' CMS emulator that is configured with average rates rather than
     actual detection logic. Built to work with MachineWithFaults.
+
+    Arguments:
+    maintainer -- Maintainer that will receive work orders.
+    name -- name of the CMS.
+    value -- starting value of the CMS.
+    seed -- optional seed for the detection and false alert rolls,
+        if not set they are seeded from Python's 'random' module.
     '''
 
-    def __init__(self, maintainer, **kwargs):
-        super().__init__(maintainer, **kwargs)
+    def __init__(self, maintainer, name = None, value = 0, seed = None):
+        super().__init__(maintainer, name, value)
 
-        self.machine = {}
-        self.sense_fault_count = {}
-        # How long until fault is detected if CMS catches or if it's missed.
-        self.catch_count = {}
-        self.miss_count = {}
-        # False alert rates and missed alert rates.
-        self.miss_rate = {}
-        # False alert rate per real fault = fa_rate / (1 - fa_rate) assuming total rates of
-        self.fa_rate = {}
-        # How many false alerts are buffered.
-        self.fa_buffer = {}
+        self._fault_handling = {}  # fault name, _FaultHandling
+        # Detection and false alert rolls are drawn in batches.
+        self._uniform_samples = UniformSamplePool(seed = seed)
 
     def on_sense(self, sensor, time, data):
         raise NotImplementedError('on_sense needs to be implemented or'
@@ -251,30 +290,32 @@ class CmsEmulator(Cms):
         for this fault by one. If count reaches count_to_detection or
         on_miss_count_to_detection (based on miss_rate) a repair will be scheduled.
         '''
-        self.sense_fault_count[fault.name] += 1
-        if self.sense_fault_count[fault.name] == 1:
+        handling = self._fault_handling[fault.name]
+        count = handling.sense_fault_count + 1
+        handling.sense_fault_count = count
+        if count == 1:
             # First bad part, fault just happened
-            if random.random() < self.fa_rate[fault.name]:
-                self.fa_buffer[fault.name] += 1
-        elif self.sense_fault_count[fault.name] == self.catch_count[fault.name]:
+            if self._uniform_samples.sample() < handling.fa_rate:
+                handling.fa_buffer += 1
+        elif count == handling.catch_count:
             # reached count when a fault could be caught early
-            if random.random() >= self.miss_rate[fault.name]:
+            if self._uniform_samples.sample() >= handling.miss_rate:
                 # fault is detected now
-                self.sense_fault_count[fault.name] = 0
-                self.maintainer.create_work_order(self.machine[fault.name], fault.name)
-        elif self.sense_fault_count[fault.name] == self.miss_count[fault.name]:
+                handling.sense_fault_count = 0
+                self.maintainer.create_work_order(handling.machine, fault.name)
+        elif count == handling.miss_count:
             # fault was missed earlier by CMS and is caught now by other means
-            self.sense_fault_count[fault.name] = 0
-            self.maintainer.create_work_order(self.machine[fault.name], fault.name)
+            handling.sense_fault_count = 0
+            self.maintainer.create_work_order(handling.machine, fault.name)
 
     def check_for_false_alerts(self, allow_multiple = False):
         ''' Called when a sense event shows no ongoing faults so that false alerts can
         be triggered if any are supposed to happen.
         '''
-        for name, count in self.fa_buffer.items():
-            if count > 0 and random.random() < 0.01:
-                self.fa_buffer[name] -= 1
-                self.maintainer.create_work_order(self.machine[name], name)
+        for name, handling in self._fault_handling.items():
+            if handling.fa_buffer > 0 and self._uniform_samples.sample() < 0.01:
+                handling.fa_buffer -= 1
+                self.maintainer.create_work_order(handling.machine, name)
                 if not allow_multiple: return
 
     def configure_fault_handling(self, fault_name, machine,
@@ -284,11 +325,32 @@ class CmsEmulator(Cms):
                                    false_alert_rate = 0):
         assert miss_rate + false_alert_rate <= 1, \
             'miss_rate and false_alert_rate can not add up to more than one'
-        self.machine[fault_name] = machine
-        self.sense_fault_count[fault_name] = 0
-        self.catch_count[fault_name] = count_to_detection
-        self.miss_count[fault_name] = on_miss_count_to_detection
-        self.miss_rate[fault_name] = miss_rate / (1 - false_alert_rate)
-        self.fa_rate[fault_name] = false_alert_rate / (1 - false_alert_rate)
-        self.fa_buffer[fault_name] = 0
+        self._fault_handling[fault_name] = _FaultHandling(
+            machine,
+            count_to_detection,
+            on_miss_count_to_detection,
+            miss_rate / (1 - false_alert_rate),
+            false_alert_rate / (1 - false_alert_rate)
+        )
+
+
+class _FaultHandling:
+    '''CmsEmulator configuration and state for a single fault, kept
+    together so each sensed fault needs only one dictionary lookup.
+    '''
+
+    __slots__ = ('machine', 'catch_count', 'miss_count', 'miss_rate', 'fa_rate',
+                 'sense_fault_count', 'fa_buffer')
 
+    def __init__(self, machine, catch_count, miss_count, miss_rate, fa_rate):
+        self.machine = machine
+        # How long until fault is detected if CMS catches or if it's missed.
+        self.catch_count = catch_count
+        self.miss_count = miss_count
+        # False alert rates and missed alert rates.
+        self.miss_rate = miss_rate
+        # False alert rate per real fault = fa_rate / (1 - fa_rate) assuming total rates of
+        self.fa_rate = fa_rate
+        self.sense_fault_count = 0
+        # How many false alerts are buffered.
+        self.fa_buffer = 0
@@ -42,6 +42,8 @@ class ActionScheduler(Asset):
 
     def initialize(self, env):
         super().initialize(env)
+        # Event message is the same for every transition.
+        self._transition_message = f'Schedule update: {self.name}'
         self._update_state(False)
 
     @property
@@ -126,14 +128,17 @@ class ActionScheduler(Asset):
                 self.default_action(obj, self.env.now, self.current_state)
             else:
                 action(self, obj, self.env.now, self.current_state)
-        self._schedule_next_transition(self._schedule[self._schedule_index][0])
+        # Last state of an acyclical schedule persists indefinitely so
+        # there is no transition to schedule.
+        if self._is_cyclical or self._schedule_index < len(self._schedule) - 1:
+            self._schedule_next_transition(self._schedule[self._schedule_index][0])
 
     def _schedule_next_transition(self, delay):
         self._env.schedule_event(self._env.now + delay,
                                  self.id,
                                  self._update_state,
                                  EventType.OTHER_HIGH_PRIORITY,
-                                 f'Schedule update: {self.name}')
+                                 self._transition_message)
 
     def default_action(self, obj, time, new_state):
         ''' Default action to be performed for each registered object
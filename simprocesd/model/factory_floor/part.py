@@ -37,6 +37,29 @@ class Part(Asset):
         '''
         return self._routing_history.copy()
 
+    def get_routing_history_entry(self, index):
+        '''Get a single device from the routing history without
+        creating the full routing_history list.
+
+        Arguments
+        ---------
+        index: int
+            Index of an element in the routing history, negative
+            indexes count from the end.
+
+        Returns
+        -------
+        PartFlowController
+            Device at the specified index of the routing history.
+
+        Raises
+        ------
+        IndexError
+            If the provided index is outside the routing history's
+            range.
+        '''
+        return self._routing_history[index]
+
     def add_routing_history(self, device):
         '''Adds a device to the end of the routing history.
 
@@ -1,3 +1,5 @@
+from collections import deque
+
 from .batch import Batch
 from .part_handler import PartHandler
 
@@ -36,6 +38,9 @@ class PartBatcher(PartHandler):
                     f'output_batch_size ({output_batch_size}) cannot be 0 or less.'
         self._output_batch_size = output_batch_size
         self._in_progress_batch = None
+        # Parts of the input Batch that still need to be moved to
+        # output. Deque avoids shifting the list on every removal.
+        self._input_batch_parts = None
 
     @property
     def output_batch_size(self):
@@ -61,9 +66,12 @@ class PartBatcher(PartHandler):
 
     def _get_part_from_input(self):
         if isinstance(self._part, Batch):
-            part = self._part.parts.pop(0)
-            if len(self._part.parts) <= 0:
+            if self._input_batch_parts == None:
+                self._input_batch_parts = deque(self._part.parts)
+            part = self._input_batch_parts.popleft()
+            if len(self._input_batch_parts) <= 0:
                 self._part = None
+                self._input_batch_parts = None
         else:  # self._part is a single Part
             part = self._part
             self._part = None
@@ -20,8 +20,10 @@ class PartFlowController(Asset):
     '''
 
     def __init__(self, name = None, upstream = None, value = 0):
-        self._downstream = []
-        self._upstream = []
+        # Stored as tuples because they are iterated whenever Parts move
+        # but change only when the production line is rearranged.
+        self._downstream = ()
+        self._upstream = ()
         self._block_input = False
         self._recursion_prevention = False
         self._joined_groups = []
@@ -46,16 +48,16 @@ class PartFlowController(Asset):
 
         Can be changed using set_upstream(new_upstream).
         '''
-        return self._upstream.copy()
+        return list(self._upstream)
 
     @property
     def downstream(self):
         '''List of downstream PartFlowControllers.
 
-        This list shouldn't be set or modified directly because it's
-        dependent on upstream settings of other PartFlowControllers.
+        Returns a copy because downstreams are dependent on upstream
+        settings of other PartFlowControllers.
         '''
-        return self._downstream
+        return list(self._downstream)
 
     @property
     def waiting_for_part_start_time(self):
@@ -105,10 +107,10 @@ class PartFlowController(Asset):
 
         Arguments
         ---------
-        new_upstream: list of PartFlowController
+        new_upstream: list or tuple of PartFlowController
             PartFlowControllers that will replace the current
             collection of upstreams.
-            If None, then an empty list will be used.
+            If None, then an empty collection will be used.
 
         Raises
         ------
@@ -121,7 +123,7 @@ class PartFlowController(Asset):
         if new_upstream == None:
             new_upstream = []
         else:
-            assert_is_instance(new_upstream, list)
+            assert_is_instance(new_upstream, (list, tuple))
         # Verify that the new upstreams are valid.
         for up in new_upstream:
             assert_is_instance(up, PartFlowController)
@@ -135,18 +137,20 @@ class PartFlowController(Asset):
 
         for up in self._upstream:
             up._remove_downstream(self)
-        self._upstream = new_upstream.copy()
+        self._upstream = tuple(new_upstream)
         for up in self._upstream:
             up._add_downstream(self)
 
     def _add_downstream(self, downstream):
         if downstream not in self._downstream:
-            self._downstream.append(downstream)
+            self._downstream += (downstream,)
             if self.env != None:
                 self.space_available_downstream()
 
     def _remove_downstream(self, downstream):
-        self._downstream.remove(downstream)
+        downstream_list = list(self._downstream)
+        downstream_list.remove(downstream)
+        self._downstream = tuple(downstream_list)
 
     def get_sorted_downstream_list(self):
         '''Get the sorted list of downstream PartFlowControllers.
@@ -156,7 +160,7 @@ class PartFlowController(Asset):
         list
             A sorted list of downstream PartFlowControllers.
         '''
-        return PartFlowController.downstream_priority_sorter(self._downstream)
+        return PartFlowController.downstream_priority_sorter(list(self._downstream))
 
     @staticmethod
     def downstream_priority_sorter(downstream):
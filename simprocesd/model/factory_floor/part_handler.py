@@ -31,8 +31,11 @@ class PartHandler(PartFlowController):
         self._next_cycle_time_offset = 0
         self._part = None
         self._output = None
-        self._received_part_callbacks = []
+        self._received_part_callbacks = ()
         self._waiting_for_downstream_space = False
+        # Event messages are built once instead of for every Part.
+        self._finish_cycle_message = f'By {self.name}'
+        self._pass_part_message = f'From {self.name}'
 
     def initialize(self, env):
         super().initialize(env)
@@ -140,7 +143,7 @@ class PartHandler(PartFlowController):
                 self.id,
                 self._finish_cycle,
                 EventType.FINISH_PROCESSING,
-                f'By {self.name}'
+                self._finish_cycle_message
             )
 
     def _finish_cycle(self):
@@ -158,7 +161,7 @@ class PartHandler(PartFlowController):
         self._waiting_for_downstream_space = False
         event_time = max(0, self._env.now + time_offset)
         self._env.schedule_event(event_time, self.id, self._pass_part_downstream,
-                                 EventType.PASS_PART, f'From {self.name}')
+                                 EventType.PASS_PART, self._pass_part_message)
 
     def _pass_part_downstream(self):
         if not self.is_operational() or self._output == None:
@@ -201,5 +204,5 @@ class PartHandler(PartFlowController):
             Function to be called.
         '''
         assert_callable(callback)
-        self._received_part_callbacks.append(callback)
+        self._received_part_callbacks += (callback,)
 
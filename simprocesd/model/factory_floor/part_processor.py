@@ -68,9 +68,11 @@ class PartProcessor(PartHandler, Maintainable):
         self._reserved_resources = None
         self._waiting_for_resources = False
 
-        self._finish_processing_callbacks = []
-        self._shutdown_callbacks = []
-        self._restored_callbacks = []
+        # Callbacks are rarely added but are iterated for every Part,
+        # tuples are a snapshot that cannot change during iteration.
+        self._finish_processing_callbacks = ()
+        self._shutdown_callbacks = ()
+        self._restored_callbacks = ()
 
         self._uptime = 0
         self._last_restore = 0
@@ -137,7 +139,7 @@ class PartProcessor(PartHandler, Maintainable):
                                      self.id,
                                      self._release_resources_if_idle,
                                      EventType.RELEASE_RESERVED_RESOURCES,
-                                     f'By {self.name}')
+                                     self._finish_cycle_message)
 
         for c in self._finish_processing_callbacks:
             c(self, self._output)
@@ -261,7 +263,7 @@ class PartProcessor(PartHandler, Maintainable):
             Function to be called.
         '''
         assert_callable(callback)
-        self._finish_processing_callbacks.append(callback)
+        self._finish_processing_callbacks += (callback,)
 
     def add_shutdown_callback(self, callback):
         '''Register a function to be called when the PartProcessor
@@ -279,7 +281,7 @@ class PartProcessor(PartHandler, Maintainable):
             Function to be called.
         '''
         assert_callable(callback)
-        self._shutdown_callbacks.append(callback)
+        self._shutdown_callbacks += (callback,)
 
     def add_restored_callback(self, callback):
         '''Register a function to be called when the PartProcessor is
@@ -294,7 +296,7 @@ class PartProcessor(PartHandler, Maintainable):
             Function to be called.
         '''
         assert_callable(callback)
-        self._restored_callbacks.append(callback)
+        self._restored_callbacks += (callback,)
 
     # Beginning of Maintainable function overrides.
     def get_work_order_duration(self, tag):
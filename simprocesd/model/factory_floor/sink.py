@@ -1,3 +1,4 @@
+from ...utils import RunningStatistics
 from . import Batch, PartHandler
 
 
@@ -22,22 +23,47 @@ class Sink(PartHandler):
     collect_parts: bool, default=False
         If True then received Parts are stored throughout the simulation
         and can be accessed under 'collected_parts'.
+    collect_attributes: list of str, default=None
+        Names of Part attributes whose values will be recorded for every
+        received Part. Values can be accessed under
+        'collected_attribute_values' without keeping the Parts.
+        Attributes can be of any type.
+    attribute_statistics: list of str, default=None
+        Names of numeric Part attributes for which the count, mean and
+        variance of received values will be tracked without storing
+        the values, memory use does not grow with the number of
+        received Parts. Statistics can be accessed under
+        'attribute_statistics'.
 
     Attributes
     ----------
     collected_parts: list
         List of received Parts in the order they were received.
+    collected_attribute_values: dict
+        Maps each name from 'collect_attributes' to a list of that
+        attribute's values in the order the Parts were received.
+    attribute_statistics: dict
+        Maps each name from the 'attribute_statistics' argument to a
+        RunningStatistics object.
     '''
 
     def __init__(self,
                  name = None,
                  upstream = None,
                  cycle_time = 0,
-                 collect_parts = False):
+                 collect_parts = False,
+                 collect_attributes = None,
+                 attribute_statistics = None):
         super().__init__(name, upstream, cycle_time = cycle_time, value = 0)
 
         self._collect_parts = collect_parts
         self.collected_parts = []
+        if collect_attributes == None:
+            collect_attributes = []
+        self.collected_attribute_values = {a: [] for a in collect_attributes}
+        if attribute_statistics == None:
+            attribute_statistics = []
+        self.attribute_statistics = {a: RunningStatistics() for a in attribute_statistics}
         self._received_parts_count = 0
         self._value_of_received_parts = 0
 
@@ -68,6 +94,10 @@ class Sink(PartHandler):
         self.add_value(f'collected_part', self._part.value)
         if self._collect_parts:
             self.collected_parts.append(self._part)
+        for attribute, values in self.collected_attribute_values.items():
+            values.append(getattr(self._part, attribute))
+        for attribute, statistics in self.attribute_statistics.items():
+            statistics.add(getattr(self._part, attribute))
 
         super()._on_received_new_part()
 
@@ -1,5 +1,3 @@
-import copy
-
 from . import EventType
 from ..utils import assert_is_instance
 
@@ -113,6 +111,26 @@ class ResourceManager:
             self._record_resource_amount_update(resource_name)
             self._schedule_check_pending_requesters()
 
+    def set_resource_capacity(self, resource_name, capacity):
+        '''Set maximum resource capacity to a specific amount.
+
+        Same as calling add_resources with the difference between
+        <capacity> and the current capacity.
+
+        Arguments
+        ---------
+        resource_name: str
+            Resource type identifier.
+        capacity: int, float
+            New maximum capacity of the resource.
+
+        Raises
+        ------
+        ValueError
+            When <capacity> is negative.
+        '''
+        self.add_resources(resource_name, capacity - self.get_resource_capacity(resource_name))
+
     def reserve_resources(self, request):
         '''Try to reserve one or more types of resources.
 
@@ -132,14 +150,15 @@ class ResourceManager:
             ReservedResources with reserved resources if successful.
             Returns None if the request could not be fulfilled.
         '''
-        filtered_request = {name: n for name, n in request.items() if n > 0}
+        filtered_request = {}
+        for resource_name, amount in request.items():
+            if amount > 0:
+                filtered_request[resource_name] = amount
+            elif amount < 0:
+                raise ValueError(f'Requested amount for {resource_name} is less than 0.')
         if self._can_fulfill_request(filtered_request):
             # Reduce pools of available resources.
-            for resource_name, amount in request.items():
-                if amount == 0:
-                    continue
-                if amount < 0:
-                    raise ValueError(f'Requested amount for {resource_name} is less than 0.')
+            for resource_name, amount in filtered_request.items():
                 in_use, max_available = self._resources[resource_name]
                 self._resources[resource_name] = (in_use + amount, max_available)
                 self._record_resource_amount_update(resource_name)
@@ -167,7 +186,8 @@ class ResourceManager:
             - the resource manager
             - copy of the request Dictionary
         '''
-        self._waiting_requests.append((copy.deepcopy(request), callback))
+        # Requests map names to amounts so a shallow copy is sufficient.
+        self._waiting_requests.append((dict(request), callback))
         self._schedule_check_pending_requesters()
 
     def _schedule_check_pending_requesters(self):
@@ -224,7 +244,7 @@ class ReservedResources():
     def reserved_resources(self):
         '''Dictionary of the resources reserved and their amounts.
         '''
-        return copy.deepcopy(self._reserved_resources)
+        return dict(self._reserved_resources)
 
     def release(self, resources = None):
         '''Release resources back into the pool of available resources.
@@ -1,4 +1,5 @@
 import copy
+import operator
 
 from ...utils import assert_is_instance, assert_callable
 from ..factory_floor import Asset
@@ -40,18 +41,29 @@ class AttributeProbe(Probe):
     Arguments
     ---------
     attribute_name: str
-        Name of the attribute to be measured.
+        Name of the attribute to be measured. Dotted names are not
+        supported, the attribute must belong to the target itself.
     target: object
         Target of the probe.
+
+    Measurement is None if the target does not have the attribute,
+    including when the attribute's getter raises an AttributeError.
     '''
 
     def __init__(self, attribute_name, target):
         assert_is_instance(attribute_name, str)
+        assert not '.' in attribute_name, \
+            f'Dotted attribute names are not supported: {attribute_name}'
         self._attribute_name = attribute_name
-        super().__init__(self._get_data, target)
+        super().__init__(operator.attrgetter(attribute_name), target)
 
-    def _get_data(self, target):
-        return getattr(target, self._attribute_name, None)
+    def probe(self):
+        # Same as getattr(target, attribute_name, None) but the getter
+        # is created once instead of looking up the name every time.
+        try:
+            return copy.copy(self._get_data(self.target))
+        except AttributeError:
+            return None
 
 
 class Sensor(Asset):
@@ -191,6 +203,8 @@ class PeriodicSensor(Sensor):
         super().__init__(probes, name, data_capacity, value)
 
         self._interval = interval
+        # Built once instead of for every scheduled measurement.
+        self._sense_event_message = f'Periodic sense by {self.name}'
 
     def initialize(self, env):
         super().initialize(env)
@@ -208,5 +222,5 @@ class PeriodicSensor(Sensor):
             self.id,
             self._periodic_sense,
             EventType.SENSOR,
-            f'Periodic sense by {self.name}'
+            self._sense_event_message
         )
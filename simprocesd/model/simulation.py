@@ -61,6 +61,11 @@ class Event:
         debugging information.
     '''
 
+    # Many Events are created during a simulation, slots reduce their
+    # memory footprint and speed up attribute access.
+    __slots__ = ('time', 'asset_id', 'action', 'event_type', 'message', 'status',
+                 'random_weight', 'paused_at', 'cancelled', 'executed')
+
     def __init__(self, time, asset_id, action, event_type, message = ''):
         if __debug__:
             assert_is_instance(asset_id, int)
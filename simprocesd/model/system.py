@@ -204,13 +204,16 @@ class System:
             - additional arguments, see *args, **kwargs
         number_of_simulations: int > 0
             Number of times to run <simulation>.
-        max_processes: int, default=0
+        max_processes: int or concurrent.futures.Executor, default=0
             Maximum number of processes to create for running
             simultaneous simulations.
             If 0, then simulations will run one after another in the
             current thread (and the current process).
             If None, then default to the number of processors on the
             machine
+            If an Executor, then simulations will be submitted to it
+            and it will not be shut down. This allows a single process
+            pool to be reused by multiple calls.
         *args, **kwargs:
             Additional arguments will be passed to the simulation
             function.
@@ -231,6 +234,9 @@ class System:
             setup does not support.
         '''
         assert number_of_simulations > 0
+        if isinstance(max_processes, concurrent.futures.Executor):
+            return System._run_on_executor(max_processes, simulation, number_of_simulations,
+                                           *args, **kwargs)
         assert max_processes == None or max_processes >= 0
 
         # Run simulations on current thread
@@ -238,16 +244,16 @@ class System:
             return [System._simulation_helper(simulation, i, *args, **kwargs) for i in range(number_of_simulations)]
 
         with concurrent.futures.ProcessPoolExecutor(max_processes) as thread_pool:
-            futures = []
-            for i in range(number_of_simulations):
-                futures.append(thread_pool.submit(System._simulation_helper,
-                                                  simulation, i, *args, **kwargs))
+            return System._run_on_executor(thread_pool, simulation, number_of_simulations,
+                                           *args, **kwargs)
 
-            systems = []
-            for i in range(number_of_simulations):
-                systems.append(futures[i].result(timeout = None))
-
-        return systems
+    @staticmethod
+    def _run_on_executor(executor, simulation, number_of_simulations, *args, **kwargs):
+        futures = []
+        for i in range(number_of_simulations):
+            futures.append(executor.submit(System._simulation_helper,
+                                           simulation, i, *args, **kwargs))
+        return [f.result(timeout = None) for f in futures]
 
     @staticmethod
     def _simulation_helper(simulation, index, *args, **kwargs):
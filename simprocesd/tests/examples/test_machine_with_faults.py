@@ -0,0 +1,57 @@
+from unittest import TestCase
+import unittest
+from unittest.mock import MagicMock
+
+from examples.machine_with_faults import MachineWithFaults
+from ...model import Environment, System, ResourceManager
+
+
+class MachineWithFaultsTestCase(TestCase):
+
+    def setUp(self):
+        self.sys = System()
+        self.env = Environment('env', MagicMock(spec = ResourceManager))
+        self.machine = MachineWithFaults('m')
+        # Hard fault occurs at time 10 and then not again until much later.
+        self.machine.add_recurring_fault('hard', get_time_to_fault = iter([10, 100]).__next__)
+        self.machine.add_recurring_fault('pending', get_time_to_fault = lambda: 30)
+        self.machine.initialize(self.env)
+
+    def maintain(self, fault_name):
+        self.machine.start_work(fault_name)
+        self.machine.end_work(fault_name)
+
+    def test_hard_fault_pauses_pending_faults(self):
+        self.env.run(15)
+        pending = self.machine._possible_faults['pending']
+        self.assertIn('hard', self.machine.active_faults)
+        self.assertFalse(self.machine.is_operational())
+        self.assertEqual(pending.scheduled_fault_time, None)
+        self.assertEqual(pending.remaining_time_to_fault, 20)
+
+    def test_fixing_maintenance_resumes_pending_faults(self):
+        self.env.run(15)
+        self.maintain('hard')
+        pending = self.machine._possible_faults['pending']
+        self.assertTrue(self.machine.is_operational())
+        self.assertEqual(pending.scheduled_fault_time, 35)
+        self.assertEqual(pending.remaining_time_to_fault, None)
+
+        self.env.run(20)
+        self.assertIn('pending', self.machine.active_faults)
+        self.assertNotIn('hard', self.machine.active_faults)
+
+    def test_false_alert_does_not_resume_pending_faults(self):
+        self.env.run(15)
+        self.maintain('pending')
+        pending = self.machine._possible_faults['pending']
+        self.assertIn('hard', self.machine.active_faults)
+        self.assertEqual(pending.scheduled_fault_time, None)
+        self.assertEqual(pending.remaining_time_to_fault, 20)
+
+        self.env.run(100)
+        self.assertNotIn('pending', self.machine.active_faults)
+
+
+if __name__ == '__main__':
+    unittest.main()
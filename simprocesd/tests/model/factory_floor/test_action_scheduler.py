@@ -97,13 +97,8 @@ class ActionSchedulerTestCase(TestCase):
         self.assertEqual(sched.current_state, obj1)
         sched._update_state()
         self.assertEqual(sched.current_state, 'banana')
-
-        if len(self.env.schedule_event.call_args_list) == 2:
-            # If a new update was scheduled then make sure it runs and
-            # does not schedule another update.
-            sched._update_state()
-            self.assertEqual(len(self.env.schedule_event.call_args_list), 2)
-        self.assertEqual(sched.current_state, 'banana')
+        # Last state persists so no further update is scheduled.
+        self.assertEqual(len(self.env.schedule_event.call_args_list), 1)
 
 
 if __name__ == '__main__':
@@ -37,6 +37,19 @@ class PartTestCase(TestCase):
         self.assertRaises(TypeError, lambda: part.add_routing_history(Asset()))
         self.assertRaises(TypeError, lambda: part.add_routing_history('test'))
 
+    def test_get_routing_history_entry(self):
+        part = Part()
+        d1, d2 = MagicMock(spec = PartFlowController), MagicMock(spec = PartFlowController)
+        part.initialize(self.env)
+        self.assertRaises(IndexError, lambda: part.get_routing_history_entry(-1))
+
+        part.add_routing_history(d1)
+        part.add_routing_history(d2)
+        self.assertIs(part.get_routing_history_entry(0), d1)
+        self.assertIs(part.get_routing_history_entry(-1), d2)
+        self.assertIs(part.get_routing_history_entry(-2), d1)
+        self.assertRaises(IndexError, lambda: part.get_routing_history_entry(2))
+
     def test_remove_routing_history(self):
         part = Part()
         d1, d2 = MagicMock(spec = PartFlowController), MagicMock(spec = PartFlowController)
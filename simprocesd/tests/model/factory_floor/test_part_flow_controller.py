@@ -1,6 +1,6 @@
 from unittest import TestCase
 import unittest
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
 from ... import mock_wrap
 from ....model import Environment, System
@@ -50,6 +50,15 @@ class PartFlowControllerTestCase(TestCase):
         self.assertEqual(self.upstream[1].downstream, [])
         self.assertEqual(new_upstream[0].downstream, [pfc])
 
+        pfc.set_upstream(tuple(self.upstream))
+        self.assertEqual(pfc.upstream, self.upstream)
+        self.assertEqual(new_upstream[0].downstream, [])
+        # Returned lists are copies.
+        pfc.upstream.clear()
+        self.upstream[0].downstream.clear()
+        self.assertEqual(pfc.upstream, self.upstream)
+        self.assertEqual(self.upstream[0].downstream, [pfc])
+
     def test_set_upstream_within_group(self):
         pfc1 = PartFlowController()
         pfc2 = PartFlowController()
@@ -208,6 +217,18 @@ class PartFlowControllerTestCase(TestCase):
         self.assertEqual(sorted_ds[2].waiting_for_part_start_time, 10)
         self.assertEqual(sorted_ds[3].waiting_for_part_start_time, None)
 
+    def test_get_sorted_downstream_list(self):
+        pfc = PartFlowController()
+        downstream = self.add_downstream(pfc)
+
+        def in_place_sorter(downstream):
+            downstream.sort(key = id)
+            return downstream
+
+        with patch.object(PartFlowController, 'downstream_priority_sorter', in_place_sorter):
+            self.assertEqual(pfc.get_sorted_downstream_list(), [downstream])
+        self.assertEqual(pfc.downstream, [downstream])
+
     def test_block_input(self):
         pfc = PartFlowController(upstream = self.upstream)
         downstream = self.add_downstream(pfc, True, 0)
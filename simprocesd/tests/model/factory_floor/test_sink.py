@@ -53,6 +53,25 @@ class SinkTestCase(TestCase):
         sink.give_part(part)
         self.assertEqual(sink.collected_parts, [part])
 
+    def test_collect_attributes(self):
+        sink = Sink(collect_attributes = ['quality', 'value'])
+        sink.initialize(self.env)
+        self.assertEqual(sink.collected_attribute_values, {'quality': [], 'value': []})
+        for i in range(3):
+            self.assertTrue(sink.give_part(Part(value = i, quality = i / 10)))
+        self.assertEqual(sink.collected_attribute_values,
+                         {'quality': [0, 0.1, 0.2], 'value': [0, 1, 2]})
+        self.assertEqual(sink.collected_parts, [])
+
+    def test_attribute_statistics(self):
+        sink = Sink(attribute_statistics = ['quality'])
+        sink.initialize(self.env)
+        for q in [0.5, 1, 1.5]:
+            self.assertTrue(sink.give_part(Part(quality = q)))
+        self.assertEqual(sink.attribute_statistics['quality'].count, 3)
+        self.assertAlmostEqual(sink.attribute_statistics['quality'].mean, 1)
+        self.assertAlmostEqual(sink.attribute_statistics['quality'].variance, 0.25)
+
     def test_receive_part(self):
         part = Part(value = 2.5)
         upstream = [mock_wrap(PartProcessor())]
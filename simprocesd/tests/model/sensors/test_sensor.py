@@ -0,0 +1,42 @@
+from unittest import TestCase
+import unittest
+
+from ....model.sensors import AttributeProbe
+
+
+class Target:
+
+    def __init__(self):
+        self.value = [1, 2]
+
+    @property
+    def broken(self):
+        raise AttributeError('broken getter')
+
+
+class AttributeProbeTestCase(TestCase):
+
+    def setUp(self):
+        self.target = Target()
+
+    def test_probe(self):
+        probe = AttributeProbe('value', self.target)
+        data = probe.probe()
+        self.assertEqual(data, [1, 2])
+        # Measurement is a copy of the attribute.
+        self.assertIsNot(data, self.target.value)
+
+    def test_probe_missing_attribute(self):
+        probe = AttributeProbe('missing', self.target)
+        self.assertEqual(probe.probe(), None)
+
+    def test_probe_getter_attribute_error(self):
+        probe = AttributeProbe('broken', self.target)
+        self.assertEqual(probe.probe(), None)
+
+    def test_dotted_name(self):
+        self.assertRaises(AssertionError, lambda: AttributeProbe('value.real', self.target))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -68,6 +68,11 @@ class EventTestCase(TestCase):
         e2.time = 0
         self.assertLess(e2, e1)
 
+    def test_slots(self):
+        event = Event(1, 1, MagicMock(), EventType.FAIL)
+        self.assertFalse(hasattr(event, '__dict__'))
+        self.assertRaises(AttributeError, lambda: setattr(event, 'unknown_attribute', 1))
+
     def test_adjusted_event_priority(self):
         action = MagicMock()
         e1 = Event(1, 1, action, EventType.FAIL)
@@ -31,6 +31,9 @@ class ResourceManagerTestCase(TestCase):
         self.rm.initialize(self.env_mock)
 
         self.assertRaises(ValueError, lambda: self.rm.reserve_resources({'a':-1}))
+        # Nothing is reserved if any requested amount is negative.
+        self.assertRaises(ValueError, lambda: self.rm.reserve_resources({'a': 1, 'b':-1}))
+        self.assert_resource_state_helper({'a': (0, 5)})
         # Zero amount can always be reserved.
         rr = self.rm.reserve_resources({'non_existent': 0})
         self.assertNotEqual(rr, None)
@@ -116,6 +119,20 @@ class ResourceManagerTestCase(TestCase):
         rr = self.rm.reserve_resources({'b': 1})
         self.assertEqual(rr, None)
 
+    def test_set_resource_capacity(self):
+        self.rm.add_resources('a', 10)
+        self.rm.initialize(self.env_mock)
+        rr = self.rm.reserve_resources({'a': 3})
+
+        self.rm.set_resource_capacity('a', 4)
+        self.assert_resource_state_helper({'a': (3, 4)})
+        self.rm.set_resource_capacity('b', 2)
+        self.assert_resource_state_helper({'a': (3, 4), 'b': (0, 2)})
+        self.rm.set_resource_capacity('b', 2)
+        self.assert_resource_state_helper({'a': (3, 4), 'b': (0, 2)})
+        self.assertRaises(ValueError, lambda: self.rm.set_resource_capacity('a', -1))
+        rr.release()
+
     def test_reserve_resources_callback(self):
         self.rm.initialize(self.env_mock)
         cb = MagicMock()
@@ -138,6 +138,23 @@ class SystemTestCase(TestCase):
 
         self.assertEqual(len(future_mock.result.call_args_list), num_of_runs)
 
+    def test_simulate_multiple_times_executor(self):
+        future_mock = MagicMock(spec = concurrent.futures.Future)
+        executor = MagicMock(spec = concurrent.futures.Executor)
+        executor.submit.return_value = future_mock
+        simulation_func = MagicMock(spec = callable)
+        num_of_runs = 3
+        rtn_systems = System.simulate_multiple_times(simulation_func, num_of_runs, executor, a = 1)
+
+        self.assertEqual(len(rtn_systems), num_of_runs)
+        self.assertEqual(executor.submit.call_count, num_of_runs)
+        for i in range(num_of_runs):
+            args, kwargs = executor.submit.call_args_list[i]
+            self.assertEqual(args[1], simulation_func)
+            self.assertEqual(args[2], i)
+            self.assertEqual(kwargs['a'], 1)
+        executor.shutdown.assert_not_called()
+
     def test_simulate_multiple_times_same_thread(self):
         simulation_func = MagicMock(spec = callable)
         num_of_runs = 3
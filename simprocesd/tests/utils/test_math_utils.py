@@ -0,0 +1,103 @@
+import random
+import statistics
+from unittest import TestCase
+import unittest
+
+from ...utils import geometric_distribution_sample, GeometricSamplePool, UniformSamplePool, RunningStatistics
+
+
+class GeometricDistributionSampleTestCase(TestCase):
+
+    def test_edge_probabilities(self):
+        self.assertEqual(geometric_distribution_sample(0), float('inf'))
+        self.assertEqual(geometric_distribution_sample(1, 3), 3)
+        self.assertRaises(AssertionError, lambda: geometric_distribution_sample(1.5))
+
+    def test_samples(self):
+        random.seed(3)
+        samples = [geometric_distribution_sample(0.1, 4) for i in range(2000)]
+        self.assertGreaterEqual(min(samples), 4)
+        self.assertTrue(all(isinstance(s, int) for s in samples))
+        # Expected mean is target_successes / probability = 40
+        self.assertAlmostEqual(statistics.mean(samples), 40, delta = 2)
+
+
+class GeometricSamplePoolTestCase(TestCase):
+
+    def test_edge_probabilities(self):
+        pool = GeometricSamplePool(0, batch_size = 3)
+        for i in range(5):
+            self.assertEqual(pool.sample(), float('inf'))
+        pool = GeometricSamplePool(1, 3)
+        for i in range(5):
+            self.assertEqual(pool.sample(), 3)
+        self.assertRaises(AssertionError, lambda: GeometricSamplePool(1.5))
+        self.assertRaises(AssertionError, lambda: GeometricSamplePool(0.5, batch_size = 0))
+
+    def test_samples(self):
+        pool = GeometricSamplePool(0.25, 2, batch_size = 100)
+        samples = [pool.sample() for i in range(1000)]
+        self.assertGreaterEqual(min(samples), 2)
+        self.assertTrue(all(isinstance(s, int) for s in samples))
+        # Expected mean is target_successes / probability = 8
+        self.assertAlmostEqual(sum(samples) / len(samples), 8, delta = 1)
+
+    def test_seeded_by_random(self):
+        random.seed(5)
+        samples1 = [GeometricSamplePool(0.1).sample() for i in range(10)]
+        random.seed(5)
+        samples2 = [GeometricSamplePool(0.1).sample() for i in range(10)]
+        self.assertEqual(samples1, samples2)
+
+
+class UniformSamplePoolTestCase(TestCase):
+
+    def test_samples(self):
+        pool = UniformSamplePool(2, 5, batch_size = 100)
+        samples = [pool.sample() for i in range(1000)]
+        self.assertGreaterEqual(min(samples), 2)
+        self.assertLess(max(samples), 5)
+        self.assertTrue(all(isinstance(s, float) for s in samples))
+        self.assertAlmostEqual(sum(samples) / len(samples), 3.5, delta = 0.2)
+        self.assertRaises(AssertionError, lambda: UniformSamplePool(1, 0))
+        self.assertRaises(AssertionError, lambda: UniformSamplePool(batch_size = 0))
+
+    def test_seeded_by_random(self):
+        random.seed(5)
+        samples1 = [UniformSamplePool().sample() for i in range(10)]
+        random.seed(5)
+        samples2 = [UniformSamplePool().sample() for i in range(10)]
+        self.assertEqual(samples1, samples2)
+
+    def test_seed(self):
+        pool1 = UniformSamplePool(batch_size = 4, seed = 7)
+        pool2 = UniformSamplePool(batch_size = 4, seed = 7)
+        samples1 = [pool1.sample() for i in range(10)]
+        random.seed(1)
+        samples2 = [pool2.sample() for i in range(10)]
+        self.assertEqual(samples1, samples2)
+        # Batches continue the same generator instead of repeating.
+        self.assertNotEqual(samples1[:4], samples1[4:8])
+
+
+class RunningStatisticsTestCase(TestCase):
+
+    def test_statistics(self):
+        stats = RunningStatistics()
+        self.assertEqual(stats.count, 0)
+        self.assertEqual(stats.mean, None)
+        self.assertEqual(stats.variance, None)
+        stats.add(3)
+        self.assertEqual(stats.mean, 3)
+        self.assertEqual(stats.variance, None)
+
+        values = [3] + [random.uniform(-5, 10) for i in range(100)]
+        for v in values[1:]:
+            stats.add(v)
+        self.assertEqual(stats.count, len(values))
+        self.assertAlmostEqual(stats.mean, statistics.mean(values))
+        self.assertAlmostEqual(stats.variance, statistics.variance(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
-from .math_utils import geometric_distribution_sample
+from .math_utils import geometric_distribution_sample, GeometricSamplePool, \
+    UniformSamplePool, RunningStatistics
 from .simulation_info_utils import print_produced_parts_and_average_quality, plot_throughput, \
     plot_damage, plot_value, simple_plot, print_finished_work_order_counts, plot_resources, \
     plot_buffer_levels
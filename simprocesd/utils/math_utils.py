@@ -1,12 +1,15 @@
+import math
 import random
 
+import numpy as np
+
 
 def geometric_distribution_sample(probability, target_successes = 1):
     '''How many Bernoulli trials will it take to reach a number of
     successes.
 
-    This function performs random trials based on provided probability.
-    Because the trials are random calling the function will same
+    The number of trials is sampled based on provided probability.
+    Because the sampling is random calling the function will same
     parameters does not mean same results.
 
     Randomness is generated with Python's 'random' module.
@@ -29,9 +32,160 @@ def geometric_distribution_sample(probability, target_successes = 1):
     elif probability == 1:
         return target_successes
 
+    # Trials needed for each success are sampled directly by inverting
+    # the geometric CDF instead of simulating every trial, which keeps
+    # the cost independent of how low the probability is.
+    log_failure_probability = math.log1p(-probability)
     trials = 0
-    while target_successes > 0:
-        trials += 1
-        if random.uniform(0, 1) < probability:
-            target_successes -= 1
+    for i in range(target_successes):
+        trials += math.floor(math.log(1 - random.random()) / log_failure_probability) + 1
     return trials
+
+
+class GeometricSamplePool:
+    '''Provides samples from the same distribution as
+    geometric_distribution_sample but generates them in batches with
+    numpy which is much faster when many samples are needed.
+
+    Each batch uses a numpy generator seeded from Python's 'random'
+    module so seeding 'random' still makes results reproducible.
+
+    Arguments
+    ---------
+    probability: float
+        Chance of success of each trial (0 to 1).
+    target_successes: int, default=1
+        Desired number of successes.
+    batch_size: int, default=1024
+        Number of samples to generate at a time.
+    '''
+
+    def __init__(self, probability, target_successes = 1, batch_size = 1024):
+        assert probability >= 0 and probability <= 1, 'probability must be 0 to 1'
+        assert batch_size >= 1, 'batch_size must be at least 1'
+        self._probability = probability
+        self._target_successes = target_successes
+        self._batch_size = batch_size
+        self._samples = []
+
+    def sample(self):
+        '''Get the next sample.
+
+        Returns
+        -------
+        int
+            Number of iterations it took to get desired number of
+            successes.
+        '''
+        if len(self._samples) == 0:
+            self._refill()
+        return self._samples.pop()
+
+    def _refill(self):
+        if self._probability == 0:
+            self._samples = [float('inf')] * self._batch_size
+            return
+        rng = np.random.default_rng(random.getrandbits(64))
+        if self._target_successes == 1:
+            samples = rng.geometric(self._probability, self._batch_size)
+        else:
+            # Negative binomial counts failures before the target number
+            # of successes.
+            samples = (rng.negative_binomial(self._target_successes, self._probability,
+                                             self._batch_size)
+                       + self._target_successes)
+        self._samples = samples.tolist()
+
+
+class UniformSamplePool:
+    '''Provides samples from a uniform distribution generated in
+    batches with numpy which is much faster than calling
+    random.uniform when many samples are needed.
+
+    Unless a seed is provided each batch uses a numpy generator seeded
+    from Python's 'random' module so seeding 'random' still makes
+    results reproducible.
+
+    Arguments
+    ---------
+    low: float, default=0
+        Lower boundary of the samples (inclusive).
+    high: float, default=1
+        Upper boundary of the samples (exclusive).
+    batch_size: int, default=1024
+        Number of samples to generate at a time.
+    seed: int, optional
+        Seed for a numpy generator owned by this pool. If provided the
+        samples do not depend on the state of Python's 'random' module.
+    '''
+
+    def __init__(self, low = 0, high = 1, batch_size = 1024, seed = None):
+        assert low <= high, 'low cannot be greater than high'
+        assert batch_size >= 1, 'batch_size must be at least 1'
+        self._low = low
+        self._high = high
+        self._batch_size = batch_size
+        self._rng = None if seed == None else np.random.default_rng(seed)
+        self._samples = []
+
+    def sample(self):
+        '''Get the next sample.
+
+        Returns
+        -------
+        float
+            Random number between low and high.
+        '''
+        if len(self._samples) == 0:
+            rng = self._rng
+            if rng == None:
+                rng = np.random.default_rng(random.getrandbits(64))
+            self._samples = rng.uniform(self._low, self._high, self._batch_size).tolist()
+        return self._samples.pop()
+
+
+class RunningStatistics:
+    '''Tracks count, mean and variance of a series of values without
+    storing the values.
+
+    Uses Welford's online algorithm which is numerically stable.
+    '''
+
+    def __init__(self):
+        self._count = 0
+        self._mean = 0.0
+        self._sum_of_squared_differences = 0.0
+
+    def add(self, value):
+        '''Add a value to the statistics.
+
+        Arguments
+        ---------
+        value: float
+            New value.
+        '''
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._sum_of_squared_differences += delta * (value - self._mean)
+
+    @property
+    def count(self):
+        '''Number of added values.
+        '''
+        return self._count
+
+    @property
+    def mean(self):
+        '''Mean of added values or None if no values were added.
+        '''
+        return self._mean if self._count > 0 else None
+
+    @property
+    def variance(self):
+        '''Sample variance of added values or None if less than two
+        values were added.
+        '''
+        if self._count < 2:
+            return None
+        return self._sum_of_squared_differences / (self._count - 1)